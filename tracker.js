@@ -0,0 +1,123 @@
+const fs = require('fs');
+const Database = require('better-sqlite3');
+
+const db = new Database('tracker.db');
+db.pragma('journal_mode = WAL');
+db.pragma('synchronous = NORMAL');
+db.exec('CREATE TABLE IF NOT EXISTS invites(guild_id TEXT, code TEXT, uses INTEGER, inviter_id TEXT, PRIMARY KEY(guild_id, code));'
+    + 'CREATE TABLE IF NOT EXISTS counts(guild_id TEXT, user_id TEXT, n INTEGER, PRIMARY KEY(guild_id, user_id));'
+    + 'CREATE TABLE IF NOT EXISTS history(guild_id TEXT, member_id TEXT, inviter_id TEXT, has_left INTEGER, rejoin_count INTEGER, is_vanity INTEGER, PRIMARY KEY(guild_id, member_id));'
+    + 'CREATE TABLE IF NOT EXISTS leaves(guild_id TEXT, user_id TEXT, n INTEGER, PRIMARY KEY(guild_id, user_id));'
+    + 'CREATE TABLE IF NOT EXISTS settings(guild_id TEXT PRIMARY KEY, log_channel TEXT);');
+const stCount = db.prepare('INSERT INTO counts(guild_id, user_id, n) VALUES(?, ?, ?) ON CONFLICT(guild_id, user_id) DO UPDATE SET n = excluded.n');
+const stHist = db.prepare('INSERT INTO history(guild_id, member_id, inviter_id, has_left, rejoin_count, is_vanity) VALUES(?, ?, ?, ?, ?, ?) ON CONFLICT(guild_id, member_id) DO UPDATE SET inviter_id = excluded.inviter_id, has_left = excluded.has_left, rejoin_count = excluded.rejoin_count, is_vanity = excluded.is_vanity');
+const stLeave = db.prepare('INSERT INTO leaves(guild_id, user_id, n) VALUES(?, ?, ?) ON CONFLICT(guild_id, user_id) DO UPDATE SET n = excluded.n');
+const stLog = db.prepare('INSERT INTO settings(guild_id, log_channel) VALUES(?, ?) ON CONFLICT(guild_id) DO UPDATE SET log_channel = excluded.log_channel');
+const stInv = db.prepare('INSERT INTO invites(guild_id, code, uses, inviter_id) VALUES(?, ?, ?, ?) ON CONFLICT(guild_id, code) DO UPDATE SET uses = excluded.uses, inviter_id = excluded.inviter_id');
+const stInvDel = db.prepare('DELETE FROM invites WHERE guild_id = ? AND code = ?');
+
+const pending = [];
+const flushPending = db.transaction(() => {
+    for (const [st, args] of pending) st.run(...args);
+    pending.length = 0;
+});
+const queueWrite = (st, ...args) => {
+    pending.push([st, args]);
+    if (pending.length >= 0x64) flushPending();
+};
+setInterval(() => pending.length && flushPending(), 0x1f4);
+const replaceInvitesTx = db.transaction((gid, m) => {
+    db.prepare('DELETE FROM invites WHERE guild_id = ?').run(gid);
+    for (const [code, v] of m) stInv.run(gid, code, v.uses, v.inviterId ?? null);
+});
+const wipeGuildTx = db.transaction((gid) => {
+    db.prepare('DELETE FROM counts WHERE guild_id = ?').run(gid);
+    db.prepare('DELETE FROM history WHERE guild_id = ?').run(gid);
+    db.prepare('DELETE FROM leaves WHERE guild_id = ?').run(gid);
+});
+try {
+    if (!db.prepare('SELECT 1 FROM counts LIMIT 1').get() && fs.existsSync('./invitedata.json')) {
+        const data = JSON.parse(fs.readFileSync('./invitedata.json', 'utf8'));
+        db.transaction(() => {
+            for (const [gId, d] of Object.entries(data)) {
+                if (d.c) for (const [uId, cnt] of Object.entries(d.c)) stCount.run(gId, uId, cnt);
+                if (d.h) for (const [uId, h] of Object.entries(d.h)) stHist.run(gId, uId, h[0] ?? null, h[1] ? 1 : 0, h[2] || 0, h[3] ? 1 : 0);
+                if (d.l) for (const [uId, cnt] of Object.entries(d.l)) stLeave.run(gId, uId, cnt);
+                if (d.lg) stLog.run(gId, d.lg);
+            }
+        })();
+        console.log('Data loaded');
+    }
+} catch (e) { console.error('Load error:', e.message); }
+
+const cache = new Map();
+// counts/memberInviters use flat 'guildId:userId' string keys. Snowflakes
+// don't fit in a double, so packing both ids into one number (or a typed
+// int-keyed native map) isn't an option here; the full data set lives in
+// SQLite and memory only holds guilds that have been touched, which keeps
+// the Map small in practice.
+const counts = new Map();
+const memberInviters = new Map();
+const history = new Map();
+const leaves = new Map();
+const logChannels = new Map();
+
+const getOrCreate = (m, g) => m.has(g) ? m.get(g) : m.set(g, new Map()).get(g);
+const key = (g, u) => g + ':' + u;
+const keyDelete = (m, g) => { const p = g + ':'; for (const k of m.keys()) k.startsWith(p) && m.delete(k); };
+const keyEntries = (m, g) => { const p = g + ':'; const out = []; for (const [k, v] of m) k.startsWith(p) && out.push([k.slice(p.length), v]); return out; };
+const getCount = (g, u) => counts.get(key(g, u)) || 0;
+const setCount = (g, u, n) => { counts.set(key(g, u), n); queueWrite(stCount, g, u, n); };
+// history records are fixed-slot arrays: [inviterId, left, rejoinCount, isVanity]
+const putHist = (g, id, d) => queueWrite(stHist, g, id, d[0] ?? null, d[1] ? 1 : 0, d[2] || 0, d[3] ? 1 : 0);
+const setLeave = (g, id, n) => { getOrCreate(leaves, g).set(id, n); queueWrite(stLeave, g, id, n); };
+const inc = (g, u) => { const k = key(g, u); const n = (counts.get(k) || 0) + 1; counts.set(k, n); queueWrite(stCount, g, u, n); };
+const dec = (g, u) => { const k = key(g, u); const n = Math.max(0, (counts.get(k) || 0) - 1); counts.set(k, n); queueWrite(stCount, g, u, n); };
+const putInvite = (g, code, uses, inviterId) => queueWrite(stInv, g, code, uses, inviterId ?? null);
+const delInvite = (g, code) => queueWrite(stInvDel, g, code);
+const setLogChannel = (g, chId) => { logChannels.set(g, chId); queueWrite(stLog, g, chId); };
+const replaceGuildInvites = (g, m) => { if (pending.length) flushPending(); replaceInvitesTx(g, m); };
+const wipeGuild = (g) => { if (pending.length) flushPending(); wipeGuildTx(g); };
+const wipeAll = () => {
+    try {
+        pending.length = 0;
+        db.exec('DELETE FROM counts; DELETE FROM history; DELETE FROM leaves; DELETE FROM invites; DELETE FROM settings;');
+        db.pragma('wal_checkpoint(TRUNCATE)');
+    } catch (e) { console.error('Save error:', e.message); }
+};
+
+const warmInviteCache = () => {
+    try {
+        for (const r of db.prepare('SELECT guild_id, code, uses, inviter_id FROM invites').all()) getOrCreate(cache, r.guild_id).set(r.code, { uses: r.uses, inviterId: r.inviter_id ?? undefined });
+    } catch (e) { console.error('Load error:', e.message); }
+};
+const loaded = new Set();
+const loadGuild = (g) => {
+    if (!g || loaded.has(g)) return;
+    loaded.add(g);
+    try {
+        for (const r of db.prepare('SELECT user_id, n FROM counts WHERE guild_id = ?').all(g)) counts.set(g + ':' + r.user_id, r.n);
+        for (const r of db.prepare('SELECT member_id, inviter_id, has_left, rejoin_count, is_vanity FROM history WHERE guild_id = ?').all(g)) {
+            getOrCreate(history, g).set(r.member_id, [r.inviter_id, !!r.has_left, r.rejoin_count, !!r.is_vanity]);
+            if (!r.has_left && r.inviter_id && !r.is_vanity) memberInviters.set(g + ':' + r.member_id, r.inviter_id);
+        }
+        for (const r of db.prepare('SELECT user_id, n FROM leaves WHERE guild_id = ?').all(g)) getOrCreate(leaves, g).set(r.user_id, r.n);
+        const s = db.prepare('SELECT log_channel FROM settings WHERE guild_id = ?').get(g);
+        if (s?.log_channel) logChannels.set(g, s.log_channel);
+    } catch (e) { console.error('Load error:', e.message); }
+};
+const flush = () => {
+    try {
+        if (pending.length) flushPending();
+        db.pragma('wal_checkpoint(TRUNCATE)');
+    } catch (e) { console.error('Save error:', e.message); }
+};
+const close = () => { flush(); db.close(); };
+
+module.exports = {
+    cache, counts, memberInviters, history, leaves, logChannels,
+    getOrCreate, key, keyDelete, keyEntries,
+    getCount, setCount, putHist, setLeave, inc, dec,
+    putInvite, delInvite, setLogChannel, replaceGuildInvites, wipeGuild, wipeAll,
+    warmInviteCache, loadGuild, flush, close
+};